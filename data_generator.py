@@ -1,13 +1,24 @@
 import json
-import math
-import random
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder.
+    orjson = None
 
 DATA_DIR = Path("data")
 RANDOM_SEED = 42
 
+# Weekly pattern indexed by date.weekday(): Tuesday-Thursday highest, weekend lowest.
+_WEEKDAY_FACTOR = np.array([1.05, 1.15, 1.18, 1.12, 1.02, 0.72, 0.78])
+
+# Seasonal pattern indexed by month - 1: spring and late-summer peaks, winter dip.
+_MONTH_SEASONAL = np.array([0.85, 0.92, 1.05, 1.12, 1.08, 0.98, 1.15, 1.18, 1.06, 1.02, 0.95, 0.88])
+
 
 def ensure_data_dir() -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -19,6 +30,12 @@ def daterange(days: int) -> List[date]:
     return [today - timedelta(days=offset) for offset in reversed(range(days))]
 
 
+def date_array(days: int) -> np.ndarray:
+    """Same span as `daterange`, as a contiguous datetime64[D] array."""
+    today = np.datetime64(date.today(), "D")
+    return np.arange(today - (days - 1), today + 1, dtype="datetime64[D]")
+
+
 def generate_daily_contributions(days: int = 321) -> List[Dict[str, object]]:
     """
     Build day-level contribution counts with weekday and seasonal patterns.
@@ -28,43 +45,41 @@ def generate_daily_contributions(days: int = 321) -> List[Dict[str, object]]:
     base_level = 40
     amplitude = 12
     season_period = 90  # days for a cycle
-    rng = random.Random(RANDOM_SEED + 1)
-
-    contributions = []
-    for i, current_date in enumerate(daterange(days)):
-        # Weekly pattern: Tuesday-Thursday highest, weekend lowest.
-        weekday = current_date.weekday()
-        weekday_factor = {
-            0: 1.05,  # Monday
-            1: 1.15,  # Tuesday
-            2: 1.18,  # Wednesday
-            3: 1.12,  # Thursday
-            4: 1.02,  # Friday
-            5: 0.72,  # Saturday
-            6: 0.78,  # Sunday
-        }[weekday]
-
-        seasonal_wave = math.sin(2 * math.pi * i / season_period)
-        seasonal_factor = 1 + 0.18 * seasonal_wave
-
-        noise = rng.uniform(-6, 6)
-        total = max(5, int((base_level + amplitude * seasonal_wave) * weekday_factor + noise))
-
-        prs = max(2, int(total * rng.uniform(0.35, 0.55)))
-        reviews = max(2, int(total * rng.uniform(0.25, 0.45)))
-        discussions = max(1, total - prs - reviews)
-
-        contributions.append(
-            {
-                "date": current_date.isoformat(),
-                "total": total,
-                "pull_requests": prs,
-                "reviews": reviews,
-                "discussions": discussions,
-            }
+    rng = np.random.default_rng(RANDOM_SEED + 1)
+
+    dates = date_array(days)
+
+    # The epoch (1970-01-01) was a Thursday, i.e. weekday 3.
+    weekdays = (dates.astype(np.int64) + 3) % 7
+    weekday_factor = _WEEKDAY_FACTOR[weekdays]
+
+    seasonal_wave = np.sin(2 * np.pi * np.arange(days) / season_period)
+
+    noise = rng.uniform(-6, 6, size=days)
+    totals = np.maximum(
+        5, ((base_level + amplitude * seasonal_wave) * weekday_factor + noise).astype(int)
+    )
+
+    prs = np.maximum(2, (totals * rng.uniform(0.35, 0.55, size=days)).astype(int))
+    reviews = np.maximum(2, (totals * rng.uniform(0.25, 0.45, size=days)).astype(int))
+    discussions = np.maximum(1, totals - prs - reviews)
+
+    return [
+        {
+            "date": current_date,
+            "total": total,
+            "pull_requests": pr_count,
+            "reviews": review_count,
+            "discussions": discussion_count,
+        }
+        for current_date, total, pr_count, review_count, discussion_count in zip(
+            dates.astype(str).tolist(),
+            totals.tolist(),
+            prs.tolist(),
+            reviews.tolist(),
+            discussions.tolist(),
         )
-
-    return contributions
+    ]
 
 
 def generate_agent_activity(agent_names: List[str]) -> List[Dict[str, object]]:
@@ -73,30 +88,34 @@ def generate_agent_activity(agent_names: List[str]) -> List[Dict[str, object]]:
     - Bias a few agents as heavy contributors.
     - Include distribution across PRs, reviews, and mentoring.
     """
-    rng = random.Random(RANDOM_SEED + 2)
-    weights = [rng.triangular(0.8, 1.5, 2.2) for _ in agent_names]
-    total_weight = sum(weights)
-
-    agents = []
-    for name, weight in zip(agent_names, weights):
-        total = int(500 * weight / total_weight * len(agent_names))
-        prs = max(5, int(total * rng.uniform(0.35, 0.55)))
-        reviews = max(5, int(total * rng.uniform(0.25, 0.45)))
-        mentoring = max(2, int(total * rng.uniform(0.08, 0.18)))
-        discussions = max(3, total - prs - reviews - mentoring)
-
-        agents.append(
-            {
-                "agent": name,
-                "total": total,
-                "pull_requests": prs,
-                "reviews": reviews,
-                "mentoring": mentoring,
-                "discussions": discussions,
-            }
+    rng = np.random.default_rng(RANDOM_SEED + 2)
+    count = len(agent_names)
+    weights = rng.triangular(0.8, 1.5, 2.2, size=count)
+
+    totals = (500 * weights / weights.sum() * count).astype(int)
+    prs = np.maximum(5, (totals * rng.uniform(0.35, 0.55, size=count)).astype(int))
+    reviews = np.maximum(5, (totals * rng.uniform(0.25, 0.45, size=count)).astype(int))
+    mentoring = np.maximum(2, (totals * rng.uniform(0.08, 0.18, size=count)).astype(int))
+    discussions = np.maximum(3, totals - prs - reviews - mentoring)
+
+    return [
+        {
+            "agent": name,
+            "total": total,
+            "pull_requests": pr_count,
+            "reviews": review_count,
+            "mentoring": mentoring_count,
+            "discussions": discussion_count,
+        }
+        for name, total, pr_count, review_count, mentoring_count, discussion_count in zip(
+            agent_names,
+            totals.tolist(),
+            prs.tolist(),
+            reviews.tolist(),
+            mentoring.tolist(),
+            discussions.tolist(),
         )
-
-    return agents
+    ]
 
 
 def generate_collaboration_network(agent_names: List[str]) -> Dict[str, List[Dict[str, object]]]:
@@ -104,26 +123,37 @@ def generate_collaboration_network(agent_names: List[str]) -> Dict[str, List[Dic
     Create undirected weighted edges between agents to reflect co-work.
     - Heavier weights for pairs that tend to collaborate more.
     """
-    rng = random.Random(RANDOM_SEED + 3)
-    edges: List[Tuple[str, str, int]] = []
-
-    for i, source in enumerate(agent_names):
-        for target in agent_names[i + 1 :]:
-            base = rng.triangular(2, 18, 10)
-            if source.startswith("Agent A") or target.startswith("Agent A"):
-                base *= 1.35
-            if "Ops" in source or "Ops" in target:
-                base *= 0.85
-            weight = max(1, int(base + rng.uniform(-2, 3)))
-            edges.append((source, target, weight))
-
-    edges_sorted = sorted(edges, key=lambda e: e[2], reverse=True)
+    nodes = [{"id": name} for name in agent_names]
+    if len(agent_names) < 2:
+        # No pairs to weight; skip the array pipeline entirely.
+        return {"nodes": nodes, "edges": []}
+
+    rng = np.random.default_rng(RANDOM_SEED + 3)
+    sources, targets = np.triu_indices(len(agent_names), k=1)
+    pair_count = len(sources)
+
+    # The mean of two uniforms is triangular on [0, 1] with mode 0.5, so this
+    # matches triangular(2, 10, 18) without a per-edge sampler call.
+    base = 2 + 16 * rng.random((2, pair_count)).mean(axis=0)
+    # Classify each agent once; pairs then combine per-agent flags.
+    is_a = np.array([name.startswith("Agent A") for name in agent_names])
+    is_ops = np.array(["Ops" in name for name in agent_names])
+    touches_a = is_a[sources] | is_a[targets]
+    touches_ops = is_ops[sources] | is_ops[targets]
+    base = np.where(touches_a, base * 1.35, base)
+    base = np.where(touches_ops, base * 0.85, base)
+    weights = np.maximum(1, (base + rng.uniform(-2, 3, size=pair_count)).astype(int))
+
+    # Drop weight-1 edges before sorting so only emitted edges are ordered.
+    kept = np.flatnonzero(weights > 1)
+    order = kept[np.argsort(-weights[kept], kind="stable")]
     return {
-        "nodes": [{"id": name} for name in agent_names],
+        "nodes": nodes,
         "edges": [
-            {"source": s, "target": t, "weight": w}
-            for s, t, w in edges_sorted
-            if w > 1
+            {"source": agent_names[s], "target": agent_names[t], "weight": w}
+            for s, t, w in zip(
+                sources[order].tolist(), targets[order].tolist(), weights[order].tolist()
+            )
         ],
     }
 
@@ -135,22 +165,25 @@ def generate_topic_evolution(
     Model topic strength over time in weekly buckets.
     - Uses phased sine waves so topics peak at different moments.
     """
-    rng = random.Random(RANDOM_SEED + 4)
+    rng = np.random.default_rng(RANDOM_SEED + 4)
     start_date = date.today() - timedelta(days=periods * period_length_days)
-    topic_phase = {topic: rng.uniform(0, 2 * math.pi) for topic in topics}
-    topic_base = {topic: rng.uniform(0.6, 1.2) for topic in topics}
+    phases = rng.uniform(0, 2 * np.pi, size=len(topics))
+    bases = rng.uniform(0.6, 1.2, size=len(topics))
+    noise = rng.uniform(-6, 8, size=(periods, len(topics)))
+
+    # One (periods x topics) grid of phased waves instead of a sin call per cell.
+    waves = np.sin(2 * np.pi * np.arange(periods)[:, None] / periods + phases)
+    volumes = np.maximum(5, (50 * bases * (1 + 0.6 * waves) + noise).astype(int)).tolist()
 
     timeline = []
     for i in range(periods):
         period_start = start_date + timedelta(days=i * period_length_days)
-        for topic in topics:
-            wave = math.sin(2 * math.pi * i / periods + topic_phase[topic])
-            momentum = topic_base[topic] * (1 + 0.6 * wave)
-            volume = max(5, int(50 * momentum + rng.uniform(-6, 8)))
+        period_end = period_start + timedelta(days=period_length_days - 1)
+        for topic, volume in zip(topics, volumes[i]):
             timeline.append(
                 {
                     "period_start": period_start.isoformat(),
-                    "period_end": (period_start + timedelta(days=period_length_days - 1)).isoformat(),
+                    "period_end": period_end.isoformat(),
                     "topic": topic,
                     "volume": volume,
                 }
@@ -164,54 +197,47 @@ def generate_historical_trends(months: int = 36) -> List[Dict[str, object]]:
     Generate monthly contribution totals with seasonal patterns and upward drift.
     - Peaks in spring and late summer; dip in winter holidays.
     """
-    rng = random.Random(RANDOM_SEED + 5)
-    today = date.today().replace(day=1)
-    entries = []
-
-    for i in range(months):
-        month_date = today - timedelta(days=30 * (months - i - 1))
-        month_index = month_date.month
-
-        seasonal_factor = {
-            1: 0.85,
-            2: 0.92,
-            3: 1.05,
-            4: 1.12,
-            5: 1.08,
-            6: 0.98,
-            7: 1.15,
-            8: 1.18,
-            9: 1.06,
-            10: 1.02,
-            11: 0.95,
-            12: 0.88,
-        }[month_index]
-
-        growth = 1 + 0.01 * i
-        base = 800
-        total = max(200, int(base * seasonal_factor * growth + rng.uniform(-60, 90)))
-        prs = max(50, int(total * rng.uniform(0.38, 0.52)))
-        reviews = max(40, int(total * rng.uniform(0.28, 0.4)))
-        discussions = max(20, total - prs - reviews)
-
-        entries.append(
-            {
-                "month": month_date.isoformat(),
-                "total": total,
-                "pull_requests": prs,
-                "reviews": reviews,
-                "discussions": discussions,
-            }
+    rng = np.random.default_rng(RANDOM_SEED + 5)
+    today = np.datetime64(date.today().replace(day=1), "D")
+    offsets = np.arange(months)
+    month_dates = today - (30 * (months - offsets - 1)).astype("timedelta64[D]")
+    month_index = month_dates.astype("datetime64[M]").astype(int) % 12 + 1
+    seasonal_factor = _MONTH_SEASONAL[month_index - 1]
+
+    growth = 1 + 0.01 * offsets
+    base = 800
+    totals = np.maximum(
+        200, (base * seasonal_factor * growth + rng.uniform(-60, 90, size=months)).astype(int)
+    )
+    prs = np.maximum(50, (totals * rng.uniform(0.38, 0.52, size=months)).astype(int))
+    reviews = np.maximum(40, (totals * rng.uniform(0.28, 0.4, size=months)).astype(int))
+    discussions = np.maximum(20, totals - prs - reviews)
+
+    return [
+        {
+            "month": month,
+            "total": total,
+            "pull_requests": pr_count,
+            "reviews": review_count,
+            "discussions": discussion_count,
+        }
+        for month, total, pr_count, review_count, discussion_count in zip(
+            month_dates.astype(str).tolist(),
+            totals.tolist(),
+            prs.tolist(),
+            reviews.tolist(),
+            discussions.tolist(),
         )
-
-    return entries
+    ]
 
 
 def save_json(data: object, filename: str) -> None:
     ensure_data_dir()
     path = DATA_DIR / filename
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
 
 
 def main() -> None:
@@ -1,61 +1,153 @@
 #!/usr/bin/env python3
 """
 Fetch real GitHub contribution data for ai-village-agents organization.
-Uses the gh CLI for authenticated API access.
+Uses the gh CLI's auth token for authenticated REST API access.
 Outputs JSON files matching the dashboard's expected format.
 """
 
+import atexit
 import json
+import os
+import shelve
 import subprocess
 import sys
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
 
 ORG = "ai-village-agents"
+API_URL = "https://api.github.com"
+MAX_WORKERS = 8  # concurrent API calls; each one is a network round-trip
+CACHE_PATH = "data/.gh_cache"
+
+_cache_lock = threading.Lock()  # shelve is not safe for concurrent access
+
+# Same PRs as get_prs_for_repo (latest 100 by update time), with their reviewers.
+REVIEWS_QUERY = """
+query($owner: String!, $repo: String!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequests(first: 100, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes {
+        number
+        reviews(first: 50) { nodes { author { __typename login } } }
+      }
+    }
+  }
+}
+"""
+
+@lru_cache(maxsize=None)
+def get_session():
+    """Create one keep-alive session authenticated with GITHUB_TOKEN or `gh auth token`."""
+    token = os.environ.get("GITHUB_TOKEN") or subprocess.check_output(
+        ["gh", "auth", "token"], text=True
+    ).strip()
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+    })
+    # Let every pool worker keep its own connection open.
+    adapter = HTTPAdapter(pool_maxsize=MAX_WORKERS)
+    session.mount("https://", adapter)
+    return session
+
+@lru_cache(maxsize=None)
+def get_cache():
+    """Open the on-disk response cache mapping URL -> (etag, body, next_url)."""
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    cache = shelve.open(CACHE_PATH)
+    atexit.register(cache.close)
+    return cache
 
-def run_gh_api(endpoint):
-    """Run a gh api command and return parsed JSON."""
-    cmd = ["gh", "api", endpoint, "--paginate"]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"Error fetching {endpoint}: {result.stderr}", file=sys.stderr)
-        return []
+def api_get(endpoint, paginate=True):
+    """GET an API endpoint, following Link pagination, and return parsed JSON.
+
+    Pages are revalidated with If-None-Match; a 304 reuses the cached body.
+    """
+    session = get_session()
+    url = API_URL + endpoint
+    items = []
+    while url:
+        with _cache_lock:
+            cached = get_cache().get(url)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        try:
+            response = session.get(url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                _, data, next_url = cached
+            else:
+                response.raise_for_status()
+                data = response.json()
+                next_url = response.links.get("next", {}).get("url")
+                etag = response.headers.get("ETag")
+                if etag:
+                    with _cache_lock:
+                        get_cache()[url] = (etag, data, next_url)
+        except (requests.RequestException, ValueError) as e:
+            print(f"Error fetching {endpoint}: {e}", file=sys.stderr)
+            return []
+        if not isinstance(data, list):
+            return data
+        items.extend(data)
+        url = next_url if paginate else None
+    return items
+
+def api_graphql(query, **variables):
+    """POST a GraphQL query and return its `data` payload."""
     try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError:
-        # Handle paginated results (multiple JSON objects)
-        items = []
-        for line in result.stdout.strip().split('\n'):
-            if line:
-                try:
-                    data = json.loads(line)
-                    if isinstance(data, list):
-                        items.extend(data)
-                    else:
-                        items.append(data)
-                except:
-                    pass
-        return items
+        response = get_session().post(
+            f"{API_URL}/graphql", json={"query": query, "variables": variables}, timeout=30
+        )
+        response.raise_for_status()
+        payload = response.json()
+    except (requests.RequestException, ValueError) as e:
+        print(f"Error running GraphQL query: {e}", file=sys.stderr)
+        return {}
+    if payload.get("errors"):
+        print(f"GraphQL errors: {payload['errors']}", file=sys.stderr)
+    return payload.get("data") or {}
 
 def get_repos():
     """Get all repos in the organization."""
-    repos = run_gh_api(f"/orgs/{ORG}/repos?per_page=100")
+    repos = api_get(f"/orgs/{ORG}/repos?per_page=100")
     return [r["name"] for r in repos if not r.get("archived")]
 
 def get_contributors_for_repo(repo):
     """Get commit contributors for a repo."""
-    contributors = run_gh_api(f"/repos/{ORG}/{repo}/contributors?per_page=100")
+    contributors = api_get(f"/repos/{ORG}/{repo}/contributors?per_page=100")
     return {c["login"]: c["contributions"] for c in contributors if isinstance(c, dict)}
 
 def get_prs_for_repo(repo):
-    """Get PRs for a repo (last 100)."""
-    prs = run_gh_api(f"/repos/{ORG}/{repo}/pulls?state=all&per_page=100")
+    """Get PRs for a repo (last 100, most recently updated first)."""
+    prs = api_get(
+        f"/repos/{ORG}/{repo}/pulls?state=all&sort=updated&direction=desc&per_page=100",
+        paginate=False,
+    )
     return prs
 
-def get_reviews_for_pr(repo, pr_number):
-    """Get reviews for a specific PR."""
-    reviews = run_gh_api(f"/repos/{ORG}/{repo}/pulls/{pr_number}/reviews")
-    return reviews
+def graphql_login(actor):
+    """Return an actor's login as REST reports it (GraphQL drops the `[bot]` suffix)."""
+    login = actor["login"]
+    return f"{login}[bot]" if actor.get("__typename") == "Bot" else login
+
+def get_reviewers_for_repo(repo):
+    """Get reviewer logins per PR number for a repo's recent PRs in one query."""
+    data = api_graphql(REVIEWS_QUERY, owner=ORG, repo=repo)
+    prs = ((data.get("repository") or {}).get("pullRequests") or {}).get("nodes") or []
+    return {
+        pr["number"]: [
+            graphql_login(review["author"])
+            for review in pr["reviews"]["nodes"]
+            if review.get("author")
+        ]
+        for pr in prs
+    }
 
 def main():
     print("Fetching repos...")
@@ -70,32 +162,36 @@ def main():
         "discussions": 0
     })
     
-    # Fetch commits per contributor
-    print("\nFetching commit data...")
-    for repo in repos:
-        contributors = get_contributors_for_repo(repo)
-        for login, count in contributors.items():
-            agent_stats[login]["commits"] += count
-            agent_stats[login]["total"] += count
-    
-    # Fetch PR data
-    print("\nFetching PR data...")
-    for repo in repos:
-        prs = get_prs_for_repo(repo)
-        for pr in prs:
-            if isinstance(pr, dict) and "user" in pr:
-                author = pr["user"]["login"]
-                agent_stats[author]["pull_requests"] += 1
-                agent_stats[author]["total"] += 1
-                
-                # Get reviews for this PR (limit to first 5 PRs per repo to avoid rate limits)
-                if agent_stats[author]["pull_requests"] <= 5:
-                    reviews = get_reviews_for_pr(repo, pr["number"])
-                    for review in reviews:
-                        if isinstance(review, dict) and "user" in review:
-                            reviewer = review["user"]["login"]
-                            agent_stats[reviewer]["reviews"] += 1
-                            agent_stats[reviewer]["total"] += 1
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        # Fetch commits per contributor
+        print("\nFetching commit data...")
+        for contributors in pool.map(get_contributors_for_repo, repos):
+            for login, count in contributors.items():
+                agent_stats[login]["commits"] += count
+                agent_stats[login]["total"] += count
+
+        # Fetch PR data
+        print("\nFetching PR data...")
+        review_targets = []
+        for repo, prs in zip(repos, pool.map(get_prs_for_repo, repos)):
+            for pr in prs:
+                if isinstance(pr, dict) and "user" in pr:
+                    author = pr["user"]["login"]
+                    agent_stats[author]["pull_requests"] += 1
+                    agent_stats[author]["total"] += 1
+
+                    # Get reviews for this PR (limit to first 5 PRs per author to avoid rate limits)
+                    if agent_stats[author]["pull_requests"] <= 5:
+                        review_targets.append((repo, pr["number"]))
+
+        # Fetch reviews for the selected PRs (one GraphQL query per repo)
+        print(f"\nFetching reviews for {len(review_targets)} PRs...")
+        review_repos = list(dict.fromkeys(repo for repo, _ in review_targets))
+        reviewers_by_repo = dict(zip(review_repos, pool.map(get_reviewers_for_repo, review_repos)))
+        for repo, pr_number in review_targets:
+            for reviewer in reviewers_by_repo[repo].get(pr_number, []):
+                agent_stats[reviewer]["reviews"] += 1
+                agent_stats[reviewer]["total"] += 1
     
     # Convert to output format
     output = []
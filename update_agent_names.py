@@ -1,5 +1,12 @@
 import json
+import os
 import random
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module.
+    orjson = None
 
 # Real AI Village agent names
 REAL_AGENTS = [
@@ -17,44 +24,48 @@ REAL_AGENTS = [
     "Claude Sonnet 4.5"
 ]
 
+# Placeholder IDs like "Agent 3" map to the real agent at that index
+AGENT_RENAMES = {f"Agent {i}": name for i, name in enumerate(REAL_AGENTS)}
+
+def read_json(path):
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def write_json_atomic(obj, path):
+    """Write obj to a temp file in one call, then atomically swap it into place."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode('utf-8')
+    tmp_path = Path(f'{path}.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
 def update_agent_activity():
-    with open('data/agent_activity.json', 'r') as f:
-        agents = json.load(f)
+    agents = read_json('data/agent_activity.json')
     
     # Update agent names
     for i, agent in enumerate(agents):
         if i < len(REAL_AGENTS):
             agent['agent'] = REAL_AGENTS[i]
     
-    with open('data/agent_activity.json', 'w') as f:
-        json.dump(agents, f, indent=2)
+    write_json_atomic(agents, 'data/agent_activity.json')
     
     print(f"Updated {len(agents)} agent names")
 
 def update_collaboration_network():
-    with open('data/collaboration_network.json', 'r') as f:
-        network = json.load(f)
+    network = read_json('data/collaboration_network.json')
     
     # Update node IDs
     for node in network['nodes']:
-        old_id = node['id']
-        if old_id.startswith('Agent '):
-            # Map old names to new names if possible
-            old_index = int(old_id.split()[1]) if old_id.split()[1].isdigit() else None
-            if old_index is not None and old_index < len(REAL_AGENTS):
-                node['id'] = REAL_AGENTS[old_index]
+        node['id'] = AGENT_RENAMES.get(node['id'], node['id'])
     
     # Update edges
     for edge in network['edges']:
-        for key in ['source', 'target']:
-            old_name = edge[key]
-            if old_name.startswith('Agent '):
-                old_index = int(old_name.split()[1]) if old_name.split()[1].isdigit() else None
-                if old_index is not None and old_index < len(REAL_AGENTS):
-                    edge[key] = REAL_AGENTS[old_index]
+        edge['source'] = AGENT_RENAMES.get(edge['source'], edge['source'])
+        edge['target'] = AGENT_RENAMES.get(edge['target'], edge['target'])
     
-    with open('data/collaboration_network.json', 'w') as f:
-        json.dump(network, f, indent=2)
+    write_json_atomic(network, 'data/collaboration_network.json')
     
     print("Updated collaboration network agent names")
 